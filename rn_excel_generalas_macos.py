@@ -1,7 +1,14 @@
 import tkinter as tk
 from tkinter import simpledialog, messagebox, scrolledtext, filedialog
 import threading
+import sqlite3
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, parse_qs
+from email.utils import parsedate_to_datetime
+import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
 from datetime import datetime
 import json
@@ -10,8 +17,75 @@ import os
 from jira import JIRA, JIRAError
 import time
 import re
+import bisect
 from tkinter import ttk  # macOS-specifikus elemekhez
 
+# Párhuzamos remote link lekérések maximális száma
+REMOTE_LINK_WORKERS = 8
+
+# A feldolgozás által olvasott JIRA mezők
+REQUIRED_JIRA_FIELDS = ['summary', 'issuelinks', 'customfield_13240', 'updated']
+# A JIRA keresésben lekért mezők (telepítésenként bővíthető, a kötelező mezőket tartalmaznia kell)
+JIRA_SEARCH_FIELDS = list(REQUIRED_JIRA_FIELDS)
+
+# Lapozott JIRA keresés: lapméret, párhuzamosan letöltött lapok száma, és a mód kapcsolója
+JIRA_PAGE_SIZE = 100
+JIRA_PAGE_WORKERS = 4
+JIRA_PARALLEL_PAGES = True
+
+# Helyi JIRA cache (SQLite, a config.json mellett): méretkorlát, hány futásnyi hiány után törlődik
+# egy jegy, és mennyi időt fedjen át az inkrementális lekérdezés az előző szinkronizálással (mp)
+ISSUE_CACHE_FILE = 'jira_cache.sqlite'
+ISSUE_CACHE_MAX_ENTRIES = 20000
+ISSUE_CACHE_MAX_MISSED_RUNS = 10
+ISSUE_CACHE_SYNC_OVERLAP = 300
+# Remote link cache érvényességi ideje (mp); az üres találatok is cache-elődnek
+REMOTE_LINK_CACHE_TTL = 24 * 3600
+
+# Hostonkénti kéréskeret (kérés/másodperc, a 'default' minden más hostra érvényes), valamint a
+# 429/503 válaszok utáni újrapróbálások száma és az exponenciális várakozás alapideje (mp)
+RATE_LIMITS = {'default': 10.0}
+RATE_LIMIT_MAX_RETRIES = 5
+RATE_LIMIT_BACKOFF = 1.0
+# Csak ezek az (idempotens) kérések kerülnek újraküldésre; egy PUT a 503 válasz előtt már végrehajtódhatott
+RATE_LIMIT_RETRY_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+
+# JIRA lekérési mód: 'jira' (python-jira objektumok) vagy 'rest' (közvetlen REST hívások, nyers JSON)
+JIRA_BACKEND = 'jira'
+# Cursor alapú (nextPageToken) lapozás használata, ha a JIRA szerver támogatja; különben startAt offsetek
+JIRA_CURSOR_PAGINATION = True
+# Szerverenként megjegyzett cursor lapozás-támogatás (futás közben töltődik)
+cursor_search_support = {}
+
+# A verzió-információ (customfield_13240) mezői, a formázott szöveg sorrendjében
+VERSION_INFO_FIELDS = [
+    "Fejlesztés/javítás leírása",
+    "Érintett felhasználói kör",
+    "Fejlesztés/javítás eredménye",
+    "Új elemi jog",
+    "Új menüpont",
+    "Új eljárástípus",
+    "Adatbázis változás leírása",
+    "Érintett tábla",
+    "Érintett mező(k)",
+    "Tesztelés"
+]
+# Címkék, amelyeknél egy mező tartalma véget ér (a leírás címkéje nem ilyen, a rövid "Fejlesztés/javítás" igen)
+VERSION_INFO_BOUNDARY_FIELDS = [
+    "Fejlesztés/javítás", "Érintett felhasználói kör", "Fejlesztés/javítás eredménye",
+    "Új elemi jog", "Új menüpont", "Új eljárástípus",
+    "Adatbázis változás leírása", "Érintett tábla", "Érintett mező(k)", "Tesztelés"
+]
+VERSION_INFO_LABELS = VERSION_INFO_FIELDS + ["Fejlesztés/javítás"]
+VERSION_INFO_LABEL_RE = re.compile(
+    # Az első karakterre szűrő előretekintés miatt a motor a legtöbb pozíciót gyorsan átugorja
+    '(?=[' + ''.join(sorted({label[0] for label in VERSION_INFO_LABELS})) + '])'
+    '(?:' + '|'.join(f'(?P<label{idx}>{re.escape(label)})' for idx, label in enumerate(VERSION_INFO_LABELS)) + '):',
+    re.IGNORECASE)
+VERSION_INFO_LINE_RE = re.compile('(' + '|'.join(re.escape(field) for field in VERSION_INFO_FIELDS) + '):')
+# A normalize_issue által előállított jegy-rekord kulcsai
+RELEASE_ISSUE_COLUMNS = ['Summary', 'Ticket ID', 'Ticket URL', 'External Links', 'Version Info']
+
 
 class ConfigManager:
     def __init__(self, config_file):
@@ -43,9 +117,164 @@ class ConfigManager:
             f.write(encrypted_data)
 
 
-def connect_to_jira(jira_url, pat_token, log):
+class RateLimiter:
+    """Per-host token buckets shared by every HTTP call of a run.
+
+    Each host refills at its budget from `RATE_LIMITS` (at least 0.1 request/s). A throttled
+    response halves the host's rate and blocks it for the server's Retry-After (or an
+    exponential backoff); successful responses gradually restore the configured rate.
+    """
+
+    def __init__(self, limits=None):
+        self.limits = dict(RATE_LIMITS if limits is None else limits)
+        self.lock = threading.Lock()
+        self.buckets = {}
+
+    def _bucket(self, host):
+        bucket = self.buckets.get(host)
+        if bucket is None:
+            # A nem pozitív keret (pl. 0) nullával osztana, ezért 0,1 kérés/mp alá nem megy
+            rate = max(0.1, self.limits.get(host, self.limits.get('default', 10.0)))
+            bucket = {'max_rate': rate, 'rate': rate, 'tokens': 1.0, 'updated': time.monotonic(), 'blocked_until': 0.0}
+            self.buckets[host] = bucket
+        return bucket
+
+    def acquire(self, host):
+        """Block until a request to `host` fits into its budget."""
+        while True:
+            with self.lock:
+                bucket = self._bucket(host)
+                now = time.monotonic()
+                capacity = max(1.0, bucket['rate'])
+                bucket['tokens'] = min(capacity, bucket['tokens'] + (now - bucket['updated']) * bucket['rate'])
+                bucket['updated'] = now
+                if now >= bucket['blocked_until'] and bucket['tokens'] >= 1:
+                    bucket['tokens'] -= 1
+                    return
+                wait = max(bucket['blocked_until'] - now, (1 - bucket['tokens']) / bucket['rate'])
+            time.sleep(wait)
+
+    def throttled(self, host, delay):
+        with self.lock:
+            bucket = self._bucket(host)
+            bucket['rate'] = max(bucket['max_rate'] / 16, bucket['rate'] / 2)
+            bucket['tokens'] = 0.0
+            bucket['blocked_until'] = max(bucket['blocked_until'], time.monotonic() + delay)
+
+    def succeeded(self, host):
+        with self.lock:
+            bucket = self._bucket(host)
+            bucket['rate'] = min(bucket['max_rate'], bucket['rate'] + bucket['max_rate'] / 20)
+
+
+def retry_after_seconds(response, attempt):
+    """Seconds to wait after a throttled response: Retry-After if sent, exponential backoff otherwise."""
+    value = response.headers.get('Retry-After')
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    return RATE_LIMIT_BACKOFF * (2 ** attempt)
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTP adapter that paces requests through a `RateLimiter` and retries 429/503 responses.
+
+    Only idempotent requests (`retry_methods`) are resent: a 503 may arrive after the server
+    already applied e.g. a PUT, so those responses are returned to the caller as they are.
+    """
+
+    def __init__(self, limiter, throttle_retries=RATE_LIMIT_MAX_RETRIES, retry_methods=RATE_LIMIT_RETRY_METHODS,
+                 **kwargs):
+        super().__init__(**kwargs)
+        self.limiter = limiter
+        self.throttle_retries = throttle_retries
+        self.retry_methods = retry_methods
+
+    def send(self, request, **kwargs):
+        host = urlparse(request.url).netloc
+        retries = self.throttle_retries if request.method in self.retry_methods else 0
+        for attempt in range(retries + 1):
+            self.limiter.acquire(host)
+            response = super().send(request, **kwargs)
+            if response.status_code not in (429, 503):
+                self.limiter.succeeded(host)
+                return response
+            # A lassítás az utolsó (vagy nem ismételt) kérés után is érvényes a további kérésekre
+            self.limiter.throttled(host, retry_after_seconds(response, attempt))
+            if attempt < retries:
+                response.close()
+        return response
+
+
+def install_rate_limiter(session, limiter):
+    """Route every request of a `requests` session through `limiter`."""
+    adapter = RateLimitedAdapter(limiter, pool_maxsize=REMOTE_LINK_WORKERS + JIRA_PAGE_WORKERS)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class RestJiraClient:
+    """Lightweight JIRA REST client that returns plain JSON instead of python-jira resources.
+
+    It covers the calls of the fetch pipeline (`myself`, `search_page`, `remote_links`) over a
+    pooled `requests.Session` and keeps only the key and projected fields of each issue.
+    """
+
+    def __init__(self, server, pat_token, limiter=None):
+        self.server = server.rstrip('/')
+        self.session = requests.Session()
+        self.session.headers.update({'Authorization': f'Bearer {pat_token}', 'Accept': 'application/json'})
+        if limiter:
+            install_rate_limiter(self.session, limiter)
+        else:
+            adapter = HTTPAdapter(pool_maxsize=REMOTE_LINK_WORKERS + JIRA_PAGE_WORKERS)
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
+
+    def _get(self, path, params=None):
+        response = self.session.get(f"{self.server}/rest/api/2/{path}", params=params)
+        if not response.ok:
+            raise JIRAError(text=response.text, status_code=response.status_code, url=response.url)
+        return response.json()
+
+    def myself(self):
+        return self._get('myself')
+
+    def search_page(self, jql, start_at, max_results, fields):
+        """Return one page of a JQL search as `(issues, total)` with compact issue dicts."""
+        data = self._get('search', {'jql': jql, 'startAt': start_at, 'maxResults': max_results,
+                                    'fields': ','.join(fields)})
+        issues = [{'key': issue['key'], 'fields': issue.get('fields', {})} for issue in data.get('issues', [])]
+        return issues, data.get('total', len(issues))
+
+    def search_cursor_page(self, jql, token, max_results, fields):
+        """Return one page of the enhanced JQL search as `(issues, next page token)`."""
+        params = {'jql': jql, 'maxResults': max_results, 'fields': ','.join(fields)}
+        if token:
+            params['nextPageToken'] = token
+        data = self._get('search/jql', params)
+        issues = [{'key': issue['key'], 'fields': issue.get('fields', {})} for issue in data.get('issues', [])]
+        return issues, None if data.get('isLast', True) else data.get('nextPageToken')
+
+    def remote_links(self, issue_key):
+        return self._get(f'issue/{issue_key}/remotelink')
+
+
+def connect_to_jira(jira_url, pat_token, log, limiter=None, backend=JIRA_BACKEND):
     try:
-        jira = JIRA(server=jira_url.rstrip('/'), token_auth=pat_token)
+        if backend == 'rest':
+            jira = RestJiraClient(jira_url, pat_token, limiter)
+        else:
+            # Limiterrel a ResilientSession saját 429-újrapróbálkozása kikapcsolva, az adapter kezeli
+            jira = JIRA(server=jira_url.rstrip('/'), token_auth=pat_token, max_retries=0 if limiter else 3)
+            if limiter:
+                install_rate_limiter(jira._session, limiter)
         jira.myself()
         log("Sikeresen csatlakozva a JIRA-hoz!")
         return jira
@@ -60,79 +289,483 @@ def is_valid_domain(url):
 
 def extract_web_links(issue):
     web_links = []
-    if hasattr(issue.fields, 'issuelinks'):
-        for link in issue.fields.issuelinks:
-            if hasattr(link, 'object'):
-                web_link = link.object
-                if hasattr(web_link, 'url'):
-                    url_ = web_link.url
+    if 'issuelinks' in issue['fields']:
+        for link in issue['fields']['issuelinks']:
+            if 'object' in link:
+                web_link = link['object']
+                if 'url' in web_link:
+                    url_ = web_link['url']
                     if is_valid_domain(url_):
-                        web_links.append({"url": web_link.url, "title": web_link.url})
+                        web_links.append({"url": web_link['url'], "title": web_link['url']})
     return web_links
 
 
-def extract_remotelinks(jira, issue_key):
+def extract_remotelinks(jira, issue_key, log, cache=None, updated=None, refresh=False):
+    """Return the remote links of an issue, or None if they could not be fetched (reported through `log`)."""
+    # A cache a nyers URL-eket tárolja (a cache fájlt a másik eszköz is használja), a formázás itt történik
+    urls = cache.get_remote_links(issue_key, updated) if cache and not refresh else None
+    if urls is not None:
+        return [{"url": url, "title": url} for url in urls]
     try:
-        remotelinks = jira.remote_links(issue_key)
-        links = [{"url": link.object.url, "title": link.object.url}
-                 for link in remotelinks if
-                 hasattr(link, 'object') and hasattr(link.object, 'url') and is_valid_domain(link.object.url)]
-        return links
+        # A python-jira RemoteLink objektumok és a REST kliens nyers JSON-ja egységesen kezelve
+        remotelinks = [getattr(link, 'raw', link) for link in jira.remote_links(issue_key)]
+        urls = [link['object']['url'] for link in remotelinks if
+                'url' in link.get('object', {}) and is_valid_domain(link['object']['url'])]
+        # Csak a sikeres lekérés kerül a cache-be, az üres lista is (negatív bejegyzés)
+        if cache:
+            cache.store_remote_links(issue_key, updated, urls)
+        return [{"url": url, "title": url} for url in urls]
     except JIRAError as e:
-        print(f"Failed to fetch remote links for issue {issue_key}: {e.text}")
-        return []
+        log(f"Sikertelen remote link lekérés a(z) {issue_key} jegyhez: {e.text}")
+        return None
+    except requests.RequestException as e:
+        # Hálózati hiba (kapcsolat, időtúllépés) csak az adott jegy linkjeit érinti
+        log(f"Sikertelen remote link lekérés a(z) {issue_key} jegyhez: {str(e)}")
+        return None
 
 
-def fetch_jira_issues(jira, jql_query, is_filter, jira_url, log):
-    try:
-        start_time = time.time()
-        if is_filter:
-            issues = jira.search_issues(f'filter={jql_query}', maxResults=False)
+def get_issue_field(issue, field_name, fields, default=None):
+    """Return a field of `issue`, failing fast if it was not part of the search projection.
+
+    Fields left out of the search are simply missing from the response, so reading them
+    would silently return the default instead of the real value.
+    """
+    if field_name not in fields:
+        raise ValueError(f"A(z) '{field_name}' mező nem szerepel a lekért JIRA mezők között ({', '.join(fields)})")
+    return issue['fields'].get(field_name, default)
+
+
+def search_page(jira, jql, start_at, max_results, fields):
+    """Return one page of a JQL search as `(raw issues, total)` for either JIRA backend."""
+    if isinstance(jira, RestJiraClient):
+        return jira.search_page(jql, start_at, max_results, fields)
+    page = jira.search_issues(jql, startAt=start_at, maxResults=max_results, fields=fields)
+    return [issue.raw for issue in page], page.total
+
+
+def search_cursor_page(jira, jql, token, max_results, fields):
+    """Return one page of the enhanced (`nextPageToken`) JQL search as `(raw issues, next token)`."""
+    if isinstance(jira, RestJiraClient):
+        return jira.search_cursor_page(jql, token, max_results, fields)
+    params = {'jql': jql, 'maxResults': max_results, 'fields': ','.join(fields)}
+    if token:
+        params['nextPageToken'] = token
+    # A python-jira 3.5 még nem ismeri a search/jql végpontot, ezért a nyers JSON hívást használjuk
+    data = jira._get_json('search/jql', params=params)
+    issues = [{'key': issue['key'], 'fields': issue.get('fields', {})} for issue in data.get('issues', [])]
+    return issues, None if data.get('isLast', True) else data.get('nextPageToken')
+
+
+def iter_search_pages(jira, jql, fields, log, parallel=JIRA_PARALLEL_PAGES, page_size=JIRA_PAGE_SIZE,
+                      max_workers=JIRA_PAGE_WORKERS, cursor=JIRA_CURSOR_PAGINATION):
+    """Yield the pages of a JQL search as `(issues, total)` tuples, in result order.
+
+    Servers offering the enhanced search endpoint are paged by `nextPageToken`, which stays
+    fast however deep the result set goes. If the server answers the first attempt with 404 or
+    405 (endpoint unknown), it is marked as not supporting it and every later search falls back
+    to `iter_offset_pages`; any other error (authentication, throttling, server error) is raised.
+    """
+    server = jira.server if isinstance(jira, RestJiraClient) else jira.server_url
+    if cursor and cursor_search_support.get(server) is not False:
+        try:
+            first_page, token = search_cursor_page(jira, jql, None, page_size, fields)
+        except JIRAError as e:
+            if cursor_search_support.get(server) or e.status_code not in (404, 405):
+                raise
+            cursor_search_support[server] = False
+            log("A JIRA szerver nem támogatja a cursor alapú lapozást, offset lapozás következik")
         else:
-            issues = jira.search_issues(jql_query, maxResults=False)
+            cursor_search_support[server] = True
+            yield from iter_cursor_pages(jira, jql, fields, log, first_page, token, parallel, page_size)
+            return
+    yield from iter_offset_pages(jira, jql, fields, log, parallel, page_size, max_workers)
+
+
+def iter_cursor_pages(jira, jql, fields, log, first_page, token, parallel=JIRA_PARALLEL_PAGES,
+                      page_size=JIRA_PAGE_SIZE):
+    """Continue a cursor-paginated search from its first page and next page token.
 
-        issue_data = []
-        for idx, issue in enumerate(issues):
-            version_info = getattr(issue.fields, 'customfield_13240', None)
-            if version_info is None or version_info.strip() in ['-', '–', '_', '—'] or len(version_info.strip()) <= 3:
-                version_info = "KITÖLTENDŐ!!!"
+    The token chain makes the requests sequential, so in parallel mode only the next page is
+    prefetched while the current one is being processed. The total is unknown (None) until
+    the last page arrives.
+    """
+    executor = ThreadPoolExecutor(max_workers=1) if parallel else None
+    page = first_page
+    fetched = 0
+    future = None
+    try:
+        while True:
+            if token and executor:
+                future = executor.submit(search_cursor_page, jira, jql, token, page_size, fields)
+            fetched += len(page)
+            log(f"JIRA keresés: {fetched} jegy letöltve")
+            yield page, None if token else fetched
+            if not token:
+                break
+            page, token = future.result() if future else search_cursor_page(jira, jql, token, page_size, fields)
+            future = None
+    finally:
+        if future:
+            future.cancel()
+        if executor:
+            executor.shutdown(wait=False)
+
+
+def iter_offset_pages(jira, jql, fields, log, parallel=JIRA_PARALLEL_PAGES, page_size=JIRA_PAGE_SIZE,
+                      max_workers=JIRA_PAGE_WORKERS):
+    """Yield the pages of an offset-paginated (`startAt`) JQL search as `(issues, total)` tuples.
+
+    The first request also returns the total hit count. In parallel mode a bounded window of
+    further pages (twice the pool size) is kept in flight, and the next page is requested as
+    each one is yielded, so later pages keep downloading while earlier ones are being processed
+    without holding every page in memory; otherwise the pages are requested one after the other.
+    """
+    first_page, total = search_page(jira, jql, 0, page_size, fields)
+    fetched = len(first_page)
+    # A szerver kisebb lapméretet is kikényszeríthet, ezért az első lap méretével lapozunk tovább
+    page_size = fetched or page_size
+    starts = list(range(fetched, total, page_size)) if fetched else []
+
+    executor = None
+    futures = {}
+    window = 0
+    if parallel and starts:
+        workers = max(1, min(max_workers, len(starts)))
+        executor = ThreadPoolExecutor(max_workers=workers)
+        # Egyszerre legfeljebb ennyi lap töltődik (vagy vár feldolgozásra) a memóriában
+        window = workers * 2
+        for start in starts[:window]:
+            futures[start] = executor.submit(search_page, jira, jql, start, page_size, fields)
+    try:
+        log(f"JIRA keresés: {fetched}/{total} jegy letöltve")
+        yield first_page, total
+        for idx, start in enumerate(starts):
+            if executor:
+                page, _ = futures.pop(start).result()
+                if idx + window < len(starts):
+                    next_start = starts[idx + window]
+                    futures[next_start] = executor.submit(search_page, jira, jql, next_start, page_size, fields)
             else:
-                version_info = version_info.strip()
-
-            all_links = []
-
-            for link in issue.fields.issuelinks:
-                if hasattr(link, 'outwardIssue'):
-                    outward_issue = link.outwardIssue
-                    external_link = f"{jira_url}/browse/{outward_issue.key}"
-                    if is_valid_domain(external_link):
-                        all_links.append({"url": external_link, "title": outward_issue.key})
-
-            web_links = extract_web_links(issue)
-            all_links.extend(web_links)
-
-            remote_links = extract_remotelinks(jira, issue.key)
-            all_links.extend(remote_links)
-
-            issue_info = {
-                'Summary': issue.fields.summary,
-                'Ticket ID': issue.key,
-                'Ticket URL': f"{jira_url}/browse/{issue.key}",
-                'External Links': all_links,
-                'Version Info': version_info
-            }
-            issue_data.append(issue_info)
-            elapsed_time = time.time() - start_time
-            log(f"{idx + 1}/{len(issues)} JIRA jegy feldolgozva (Eltelt idő: {elapsed_time:.2f} másodperc)")
-
-        total_time = time.time() - start_time
-        log(f"JIRA jegyek lekérése befejeződött {total_time:.2f} másodperc alatt.")
-        return issue_data
+                page, _ = search_page(jira, jql, start, page_size, fields)
+            fetched += len(page)
+            log(f"JIRA keresés: {fetched}/{total} jegy letöltve")
+            yield page, total
+    finally:
+        if executor:
+            for future in futures.values():
+                future.cancel()
+            executor.shutdown(wait=False)
+
+
+class IssueCache:
+    """SQLite cache of projected JIRA issues with per-query sync bookkeeping.
+
+    Issues are stored as raw JSON keyed by issue key together with their `updated` stamp
+    and the run in which they were last seen. Every query remembers the field list and the
+    time of its last successful sync, which enables incremental refreshes. The URLs of the
+    remote links are cached per issue key and `updated` stamp (empty results included) until
+    `remote_link_ttl` expires; they are kept unformatted, as the cache file may be shared with
+    the other release notes tool.
+    """
+
+    def __init__(self, db_path, max_entries=ISSUE_CACHE_MAX_ENTRIES, max_missed_runs=ISSUE_CACHE_MAX_MISSED_RUNS,
+                 remote_link_ttl=REMOTE_LINK_CACHE_TTL):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.max_missed_runs = max_missed_runs
+        self.remote_link_ttl = remote_link_ttl
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute('CREATE TABLE IF NOT EXISTS issues '
+                              '(issue_key TEXT PRIMARY KEY, updated TEXT, raw TEXT, last_seen_run INTEGER)')
+            self.conn.execute('CREATE TABLE IF NOT EXISTS syncs (query TEXT PRIMARY KEY, fields TEXT, last_sync REAL)')
+            # A korábbi, eszközönként eltérően formázott remote link bejegyzések eldobva
+            self.conn.execute('DROP TABLE IF EXISTS remote_links')
+            self.conn.execute('CREATE TABLE IF NOT EXISTS remote_link_urls '
+                              '(issue_key TEXT PRIMARY KEY, updated TEXT, urls TEXT, fetched_at REAL)')
+            self.conn.execute('CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER)')
+            row = self.conn.execute("SELECT value FROM meta WHERE name = 'run'").fetchone()
+            self.run_id = (row[0] if row else 0) + 1
+            self.conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('run', ?)", (self.run_id,))
+
+    def get_last_sync(self, query, fields):
+        """Return the last sync time of `query`, or None if it was never synced with `fields`."""
+        with self.lock:
+            row = self.conn.execute('SELECT fields, last_sync FROM syncs WHERE query = ?', (query,)).fetchone()
+        if not row or json.loads(row[0]) != sorted(fields):
+            return None
+        return row[1]
+
+    def set_last_sync(self, query, fields, timestamp):
+        with self.lock, self.conn:
+            self.conn.execute('INSERT OR REPLACE INTO syncs (query, fields, last_sync) VALUES (?, ?, ?)',
+                              (query, json.dumps(sorted(fields)), timestamp))
+
+    def get_issues(self, keys):
+        """Return the cached raw issues for `keys` as a dict keyed by issue key."""
+        keys = list(keys)
+        issues = {}
+        with self.lock:
+            # Az SQLite paraméterszám-korlátja miatt darabokban kérdezünk
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                rows = self.conn.execute(
+                    f"SELECT issue_key, raw FROM issues WHERE issue_key IN ({', '.join('?' * len(chunk))})", chunk)
+                issues.update((key, json.loads(raw)) for key, raw in rows)
+        return issues
+
+    def store_issues(self, issues):
+        """Insert or refresh raw issues and mark them as seen in the current run."""
+        with self.lock, self.conn:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO issues (issue_key, updated, raw, last_seen_run) VALUES (?, ?, ?, ?)',
+                [(issue['key'], issue['fields'].get('updated'), json.dumps(issue), self.run_id) for issue in issues])
+
+    def get_remote_links(self, issue_key, updated):
+        """Return the cached remote link URLs of an issue, or None on a miss, stale stamp or expired TTL."""
+        with self.lock:
+            row = self.conn.execute('SELECT updated, urls, fetched_at FROM remote_link_urls WHERE issue_key = ?',
+                                    (issue_key,)).fetchone()
+        if not row or row[0] != updated or time.time() - row[2] >= self.remote_link_ttl:
+            return None
+        return json.loads(row[1])
+
+    def store_remote_links(self, issue_key, updated, urls):
+        with self.lock, self.conn:
+            self.conn.execute('INSERT OR REPLACE INTO remote_link_urls (issue_key, updated, urls, fetched_at) '
+                              'VALUES (?, ?, ?, ?)', (issue_key, updated, json.dumps(urls), time.time()))
+
+    def evict(self):
+        """Drop issues not seen for `max_missed_runs` runs, then the stalest ones above `max_entries`.
+
+        Remote links of evicted issues and expired remote link entries are dropped as well.
+        """
+        with self.lock, self.conn:
+            self.conn.execute('DELETE FROM issues WHERE last_seen_run <= ?', (self.run_id - self.max_missed_runs,))
+            self.conn.execute('DELETE FROM issues WHERE issue_key NOT IN '
+                              '(SELECT issue_key FROM issues ORDER BY last_seen_run DESC LIMIT ?)', (self.max_entries,))
+            self.conn.execute('DELETE FROM remote_link_urls WHERE fetched_at < ? OR issue_key NOT IN '
+                              '(SELECT issue_key FROM issues)', (time.time() - self.remote_link_ttl,))
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+def narrow_jql(jql, since):
+    """Restrict `jql` to issues updated at or after `since`, keeping its ORDER BY clause last."""
+    match = re.search(r'(?:^|\s+)order\s+by\s+', jql, re.IGNORECASE)
+    where, order = (jql[:match.start()], ' ' + jql[match.start():].strip()) if match else (jql, '')
+    if not where.strip():
+        return f'updated >= "{since}"{order}'
+    return f'({where}) AND updated >= "{since}"{order}'
+
+
+def iter_incremental_pages(jira, jql, fields, cache, last_sync, log, parallel=JIRA_PARALLEL_PAGES,
+                           page_size=JIRA_PAGE_SIZE):
+    """Yield search pages like `iter_search_pages`, downloading only what changed since `last_sync`.
+
+    A lightweight query (key and `updated` only) gives the current members in result order.
+    Issues updated since the last sync come from the narrowed JQL, unchanged ones from the
+    cache, and members the cache cannot vouch for are fetched by key.
+    """
+    members = []
+    for page, total in iter_search_pages(jira, jql, ['updated'], log, parallel=parallel):
+        members.extend((issue['key'], issue['fields'].get('updated')) for issue in page)
+
+    since = time.strftime('%Y/%m/%d %H:%M', time.localtime(last_sync - ISSUE_CACHE_SYNC_OVERLAP))
+    fresh = {}
+    for page, total in iter_search_pages(jira, narrow_jql(jql, since), fields, log, parallel=parallel):
+        fresh.update((issue['key'], issue) for issue in page)
+
+    cached = cache.get_issues(key for key, updated in members if key not in fresh)
+    missing = [key for key, updated in members
+               if key not in fresh and (key not in cached or cached[key]['fields'].get('updated') != updated)]
+    for i in range(0, len(missing), page_size):
+        key_jql = f"key in ({', '.join(missing[i:i + page_size])})"
+        for page, total in iter_search_pages(jira, key_jql, fields, log, parallel=parallel):
+            fresh.update((issue['key'], issue) for issue in page)
+    log(f"JIRA cache: {len(members) - len(fresh)} jegy a cache-ből, {len(fresh)} jegy letöltve")
+
+    issues = [fresh.get(key) or cached.get(key) for key, updated in members]
+    issues = [issue for issue in issues if issue]
+    for i in range(0, len(issues), page_size):
+        yield issues[i:i + page_size], len(issues)
+
+
+def normalize_issue(issue, fields, jira_url, remote_links):
+    """Build the record consumed by the Excel generator from a JIRA issue and its remote links."""
+    version_info = get_issue_field(issue, 'customfield_13240', fields)
+    if version_info is None or version_info.strip() in ['-', '–', '_', '—'] or len(version_info.strip()) <= 3:
+        version_info = "KITÖLTENDŐ!!!"
+    else:
+        version_info = version_info.strip()
+
+    all_links = []
+
+    for link in get_issue_field(issue, 'issuelinks', fields, []):
+        if 'outwardIssue' in link:
+            outward_issue = link['outwardIssue']
+            external_link = f"{jira_url}/browse/{outward_issue['key']}"
+            if is_valid_domain(external_link):
+                all_links.append({"url": external_link, "title": outward_issue['key']})
+
+    web_links = extract_web_links(issue)
+    all_links.extend(web_links)
+
+    all_links.extend(remote_links)
+
+    return {
+        'Summary': get_issue_field(issue, 'summary', fields),
+        'Ticket ID': issue['key'],
+        'Ticket URL': f"{jira_url}/browse/{issue['key']}",
+        'External Links': all_links,
+        'Version Info': version_info
+    }
+
+
+def iter_jira_issues(jira, jql_query, is_filter, jira_url, log, max_workers=REMOTE_LINK_WORKERS, fields=None,
+                     parallel_pages=JIRA_PARALLEL_PAGES, cache=None, force_refresh=False):
+    """Yield normalized issue records page by page while the remaining pages are downloading.
+
+    Remote links of a page are requested concurrently as soon as the page arrives, so record
+    building and the caller's own processing overlap with network I/O. With a `cache`, only
+    issues changed since the previous sync of the same query are downloaded, unless
+    `force_refresh` is set. JIRA errors of the search itself are raised to the caller.
+    """
+    fields = list(fields or JIRA_SEARCH_FIELDS)
+    missing_fields = [name for name in REQUIRED_JIRA_FIELDS if name not in fields]
+    if missing_fields:
+        log(f"Hiányzó kötelező JIRA mezők a lekérdezésből: {', '.join(missing_fields)}")
+        return
+
+    start_time = time.time()
+    jql = f'filter={jql_query}' if is_filter else jql_query
+    last_sync = cache.get_last_sync(jql, fields) if cache and not force_refresh else None
+    if last_sync is None:
+        pages = iter_search_pages(jira, jql, fields, log, parallel=parallel_pages)
+    else:
+        log(f"Inkrementális frissítés a legutóbbi szinkronizálás óta: "
+            f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(last_sync))}")
+        pages = iter_incremental_pages(jira, jql, fields, cache, last_sync, log, parallel_pages)
+
+    processed = 0
+    link_failures = 0
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as link_executor:
+        for page, total in pages:
+            if cache:
+                cache.store_issues(page)
+            # Remote linkek párhuzamos lekérése, az eredeti jegysorrend megtartásával; a szálak üzeneteit
+            # a hívó szál naplózza, így a GUI-t csak egy szál éri el
+            link_messages = deque()
+            link_futures = [link_executor.submit(extract_remotelinks, jira, issue['key'], link_messages.append,
+                                                 cache, issue['fields'].get('updated'), force_refresh)
+                            for issue in page]
+            for issue, link_future in zip(page, link_futures):
+                processed += 1
+                links = link_future.result()
+                while link_messages:
+                    log(link_messages.popleft())
+                if links is None:
+                    link_failures += 1
+                record = normalize_issue(issue, fields, jira_url, links or [])
+                elapsed_time = time.time() - start_time
+                log(f"{processed}/{total or '?'} JIRA jegy feldolgozva (Eltelt idő: {elapsed_time:.2f} másodperc)")
+                yield record
+
+    if link_failures:
+        log(f"Figyelem: {link_failures} jegy remote linkjei nem kérhetők le, a Redmine/RT hivatkozásaik hiányozhatnak.")
+    if cache:
+        cache.set_last_sync(jql, fields, start_time)
+        cache.evict()
+
+    total_time = time.time() - start_time
+    log(f"JIRA jegyek lekérése befejeződött {total_time:.2f} másodperc alatt.")
+
+
+def fetch_jira_issues(jira, jql_query, is_filter, jira_url, log, max_workers=REMOTE_LINK_WORKERS, fields=None,
+                      parallel_pages=JIRA_PARALLEL_PAGES, cache=None, force_refresh=False):
+    """Collect every record of `iter_jira_issues` into a list."""
+    try:
+        return list(iter_jira_issues(jira, jql_query, is_filter, jira_url, log, max_workers, fields, parallel_pages,
+                                     cache, force_refresh))
     except JIRAError as e:
         log(f"Sikertelen JIRA jegyek lekérése: {e.text}")
         return []
 
 
+def parse_version_info(text):
+    """Parse a customfield_13240 version-info text into a single record.
+
+    One scan of the precompiled label pattern finds every `label:` occurrence (case-insensitive,
+    anywhere in the text). A field's content is the text after its first occurrence up to the
+    next boundary label; when that is empty or '-', the rest of its line is used instead. The
+    record maps every `VERSION_INFO_FIELDS` label to its content ('' when missing) and holds
+    the line-formatted text under 'formatted'.
+    """
+    record = dict.fromkeys(VERSION_INFO_FIELDS, "")
+    if not text or text == "KITÖLTENDŐ!!!":
+        record['formatted'] = text
+        return record
+
+    first_matches = {}
+    boundaries = []
+    for match in VERSION_INFO_LABEL_RE.finditer(text):
+        label = VERSION_INFO_LABELS[int(match.lastgroup[len('label'):])]
+        first_matches.setdefault(label, match)
+        if label in VERSION_INFO_BOUNDARY_FIELDS:
+            boundaries.append(match.start())
+
+    for label, match in first_matches.items():
+        if label not in record:
+            continue
+        start = match.end()
+        idx = bisect.bisect_left(boundaries, start)
+        content = text[start:boundaries[idx] if idx < len(boundaries) else len(text)].strip()
+        if not content or content == "-":
+            line_end = text.find('\n', start)
+            content = text[start:line_end if line_end != -1 else len(text)].strip()
+        record[label] = content if content != "-" else ""
+
+    # Formázott szöveg: a mezők sorai címkével, a folytatósorok behúzva
+    formatted_lines = []
+    current_field = None
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        match = VERSION_INFO_LINE_RE.match(line)
+        if match:
+            current_field = match.group(1)
+            formatted_lines.append(f"{current_field}: {line.split(':', 1)[1].strip()}")
+        elif current_field:
+            formatted_lines.append(f"  {line}")
+    record['formatted'] = '\n'.join(formatted_lines)
+    return record
+
+
+def release_notes_columns(issues, collected=None):
+    """Build the columns of the Release Notes sheet while consuming the `issues` records.
+
+    Each record goes into the column lists (its version info parsed) as soon as it arrives,
+    so with the streaming `iter_jira_issues` this overlaps with the download of the remaining
+    pages. Returns a DataFrame with the `RELEASE_ISSUE_COLUMNS` but 'Version Info', plus one
+    column per `VERSION_INFO_FIELDS` label and 'formatted'. The records are appended to
+    `collected` when given.
+    """
+    issue_columns = [name for name in RELEASE_ISSUE_COLUMNS if name != 'Version Info']
+    columns = {name: [] for name in issue_columns + VERSION_INFO_FIELDS + ['formatted']}
+    for issue in issues:
+        if collected is not None:
+            collected.append(issue)
+        for name in issue_columns:
+            columns[name].append(issue[name])
+        for name, value in parse_version_info(issue['Version Info']).items():
+            columns[name].append(value)
+    return pd.DataFrame(columns)
+
+
 class GUIApp:
     def __init__(self, root, config_manager):
         self.root = root
@@ -180,6 +813,12 @@ class GUIApp:
         self.date_entry.pack(side=tk.LEFT, padx=5)
         self.date_entry.insert(0, datetime.now().strftime("%Y%m%d"))
 
+        # Teljes frissítés kapcsoló
+        self.full_refresh_var = tk.BooleanVar(value=False)
+        self.full_refresh_check = ttk.Checkbutton(input_frame, text="Teljes frissítés (JIRA cache mellőzése)",
+                                                  variable=self.full_refresh_var)
+        self.full_refresh_check.pack(anchor=tk.W, pady=2)
+
         # Kimenet szövegmező
         self.output_text = scrolledtext.ScrolledText(main_container, width=100, height=20)
         self.output_text.pack(fill=tk.BOTH, expand=True, pady=5)
@@ -226,125 +865,33 @@ class GUIApp:
         thread = threading.Thread(target=self.run)
         thread.start()
 
-    def extract_field_content(self, text, field_name):
-        if not text or text == "KITÖLTENDŐ!!!":
-            return ""
-
-        escaped_field_name = re.escape(field_name)
-
-        next_fields = [
-            "Fejlesztés/javítás", "Érintett felhasználói kör", "Fejlesztés/javítás eredménye", 
-            "Új elemi jog", "Új menüpont", "Új eljárástípus", 
-            "Adatbázis változás leírása", "Érintett tábla", "Érintett mező(k)", "Tesztelés"
-        ]
-
-        escaped_next_fields = "|".join([re.escape(field) for field in next_fields])
+    def generate_excel(self, issues, version, install_date, output_path=None):
+        # A Release Notes oszlopai jegyenként, a további jegyek letöltésével párhuzamosan épülnek
+        columns = release_notes_columns(issues)
 
-        # Keresési minták a különböző formátumokhoz
-        patterns = [
-            f"{escaped_field_name}:(.*?)(?=(?:{escaped_next_fields}):|\Z)",
-            f"{escaped_field_name}:(.*?)(?=\n|$)",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
-            if match:
-                content = match.group(1).strip()
-                if content and content != "-":
-                    return content
-        return ""
-
-    def format_version_info(self, text):
-        if not text or text == "KITÖLTENDŐ!!!":
-            return text
-
-        # A formázandó mezők listája
-        fields = [
-            "Fejlesztés/javítás leírása",
-            "Érintett felhasználói kör",
-            "Fejlesztés/javítás eredménye",
-            "Új elemi jog",
-            "Új menüpont",
-            "Új eljárástípus",
-            "Adatbázis változás leírása",
-            "Érintett tábla",
-            "Érintett mező(k)",
-            "Tesztelés"
+        external_links = [
+            '\n'.join(f'=HYPERLINK("{link["url"]}", "{link["title"]}")' for link in links) if links else 'N/A'
+            for links in columns['External Links']
         ]
-
-        # A szöveg sorokra bontása
-        lines = text.split('\n')
-        formatted_lines = []
-        current_field = None
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            # Mező kezdetének keresése
-            for field in fields:
-                if line.startswith(f"{field}:"):
-                    current_field = field
-                    formatted_lines.append(f"{field}: {line.split(':', 1)[1].strip()}")
-                    break
-            else:
-                if current_field and line:
-                    formatted_lines.append(f"  {line}")
-
-        return '\n'.join(formatted_lines)
-
-    def generate_excel(self, issues, version, install_date, output_path=None):
-        excel_data = []
-        for issue in issues:
-            external_links = []
-            if issue['External Links']:
-                for link in issue['External Links']:
-                    external_links.append(f'=HYPERLINK("{link["url"]}", "{link["title"]}")')
-            external_links_str = '\n'.join(external_links) if external_links else 'N/A'
-
-            ticket_link = f'=HYPERLINK("{issue["Ticket URL"]}", "{issue["Ticket ID"]}")'
-            version_info = issue['Version Info']
-
-            # Mezők kinyerése
-            description = self.extract_field_content(version_info, "Fejlesztés/javítás leírása")
-            users = self.extract_field_content(version_info, "Érintett felhasználói kör")
-            result = self.extract_field_content(version_info, "Fejlesztés/javítás eredménye")
-
-            # Új jogok/menük/eljárástípusok külön-külön
-            new_rights = self.extract_field_content(version_info, "Új elemi jog")
-            new_menu = self.extract_field_content(version_info, "Új menüpont")
-            new_procedure = self.extract_field_content(version_info, "Új eljárástípus")
-
-            # Adatbázis változások
-            db_change_desc = self.extract_field_content(version_info, "Adatbázis változás leírása")
-            affected_table = self.extract_field_content(version_info, "Érintett tábla")
-            affected_fields = self.extract_field_content(version_info, "Érintett mező(k)")
-
-            testing = self.extract_field_content(version_info, "Tesztelés")
-
-            # Formázott verzió információ
-            formatted_version_info = self.format_version_info(version_info)
-
-            excel_data.append({
-                'Fejlesztés/javítás': issue['Summary'],
-                'Szállító belső issue': ticket_link,
-                'Redmine, RT jegy': external_links_str,
-                'Fejlesztés/javítás leírása': formatted_version_info,
-                'Érintett felhasználói kör': users,
-                'Fejlesztés/javítás eredménye': result,
-                'Új elemi jog': new_rights if new_rights and new_rights != "-" else "",
-                'Új menüpont': new_menu if new_menu and new_menu != "-" else "",
-                'Új eljárástípus': new_procedure if new_procedure and new_procedure != "-" else "",
-                'Adatbázis változás leírása': db_change_desc if db_change_desc and db_change_desc != "-" else "",
-                'Érintett tábla': affected_table if affected_table and affected_table != "-" else "",
-                'Érintett mező(k)': affected_fields if affected_fields and affected_fields != "-" else "",
-                'Tesztelés módja': testing,
-                'Felelős': '',
-                'Státusz': ''
-            })
-
-        df = pd.DataFrame(excel_data)
+        ticket_links = [f'=HYPERLINK("{url}", "{key}")' for url, key in zip(columns['Ticket URL'], columns['Ticket ID'])]
+
+        df = pd.DataFrame({
+            'Fejlesztés/javítás': columns['Summary'],
+            'Szállító belső issue': ticket_links,
+            'Redmine, RT jegy': external_links,
+            'Fejlesztés/javítás leírása': columns['formatted'],
+            'Érintett felhasználói kör': columns['Érintett felhasználói kör'],
+            'Fejlesztés/javítás eredménye': columns['Fejlesztés/javítás eredménye'],
+            'Új elemi jog': columns['Új elemi jog'],
+            'Új menüpont': columns['Új menüpont'],
+            'Új eljárástípus': columns['Új eljárástípus'],
+            'Adatbázis változás leírása': columns['Adatbázis változás leírása'],
+            'Érintett tábla': columns['Érintett tábla'],
+            'Érintett mező(k)': columns['Érintett mező(k)'],
+            'Tesztelés módja': columns['Tesztelés'],
+            'Felelős': '',
+            'Státusz': ''
+        })
         version = version.lower().replace('v', '')
         
         if output_path:
@@ -496,17 +1043,29 @@ class GUIApp:
 
         self.log(f"Kinyert lekérdezés/szűrő: {query_or_filter} (szűrő: {is_filter})")
 
-        jira = connect_to_jira(jira_url, jira_pat_token, self.log)
+        limiter = RateLimiter()
+        jira = connect_to_jira(jira_url, jira_pat_token, self.log, limiter)
         if not jira:
             self.log("Sikertelen csatlakozás a JIRA-hoz.")
             messagebox.showerror("Hiba", "Sikertelen csatlakozás a JIRA-hoz")
             return
 
-        issues = fetch_jira_issues(jira, query_or_filter, is_filter, jira_url, self.log)
-        if not issues:
+        cache_path = os.path.join(os.path.dirname(os.path.abspath(self.config_manager.config_file)), ISSUE_CACHE_FILE)
+        cache = IssueCache(cache_path)
+        issues = iter_jira_issues(jira, query_or_filter, is_filter, jira_url, self.log,
+                                  cache=cache, force_refresh=self.full_refresh_var.get())
+        try:
+            first_issue = next(issues, None)
+        except JIRAError as e:
+            self.log(f"Sikertelen JIRA jegyek lekérése: {e.text}")
+            first_issue = None
+        if first_issue is None:
+            cache.close()
             self.log("Nincs találat, vagy sikertelen volt a lekérdezés.")
             messagebox.showerror("Hiba", "Nincs találat, vagy sikertelen volt a lekérdezés.")
             return
+        # A további jegyek letöltése a feldolgozással párhuzamosan, folyamként történik
+        issues = itertools.chain([first_issue], issues)
 
         try:
             # Alapértelmezett fájlnév előkészítése
@@ -533,6 +1092,8 @@ class GUIApp:
         except Exception as e:
             self.log(f"Hiba történt az Excel generálása során: {str(e)}")
             messagebox.showerror("Hiba", f"Hiba történt az Excel generálása során: {str(e)}")
+        finally:
+            cache.close()
 
     @staticmethod
     def extract_query_from_url(url):